@@ -0,0 +1,96 @@
+import functools
+import json
+import logging
+import os
+import sys
+from neo4j import AsyncGraphDatabase
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Read Aura credentials
+AURA_URI = os.getenv("NEO4J_URI")
+AURA_USER = os.getenv("NEO4J_USER")
+AURA_PASSWORD = os.getenv("NEO4J_PASSWORD")
+# Naming the database up front spares the driver a routing round-trip per session
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
+
+# Bolt connection pool settings, sized for many concurrent sessions
+DRIVER_CONFIG = {
+    "max_connection_pool_size": int(os.getenv("NEO4J_MAX_POOL_SIZE", "50")),
+    "connection_acquisition_timeout": float(os.getenv("NEO4J_ACQUISITION_TIMEOUT", "30")),
+    "max_connection_lifetime": float(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "1800")),
+    "keep_alive": True,
+}
+
+# On-disk copy of the tool catalog, reused while the :Tool count is unchanged
+TOOL_CACHE_PATH = os.getenv("RIC_TOOL_CACHE", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".tool_cache.json"))
+
+# Check if the environment variables are set
+if not all([AURA_URI, AURA_USER, AURA_PASSWORD]):
+    print("FATAL: Please set the NEO4J_URI, NEO4J_USER, and NEO4J_PASSWORD environment variables.")
+    sys.exit(1)
+
+
+@functools.lru_cache(maxsize=1)
+def get_driver():
+    """
+    Returns the process-wide async driver, creating it on first use.
+    """
+    return AsyncGraphDatabase.driver(AURA_URI, auth=(AURA_USER, AURA_PASSWORD), **DRIVER_CONFIG)
+
+
+async def close_driver():
+    """
+    Closes the process-wide driver; the next get_driver() call builds a fresh one.
+    """
+    if get_driver.cache_info().currsize:
+        await get_driver().close()
+        get_driver.cache_clear()
+
+
+async def get_all_tool_ids(driver, required=()) -> list:
+    """
+    Returns every Tool id. The catalog is cached on disk and re-read from Neo4j
+    when the :Tool count (a count-store lookup) has changed or when any id in
+    `required` is missing from it, e.g. after tools were renamed or replaced.
+    """
+    cache_key = {"uri": AURA_URI, "database": NEO4J_DATABASE}
+    async with driver.session(database=NEO4J_DATABASE) as session:
+        result = await session.run("MATCH (t:Tool) RETURN count(t) AS toolCount")
+        tool_count = (await result.single())["toolCount"]
+
+        cached = _read_tool_cache()
+        if (
+            cached is not None
+            and cached.get("key") == cache_key
+            and cached.get("count") == tool_count
+            and set(required).issubset(cached["tools"])
+        ):
+            return cached["tools"]
+
+        logger.debug("Tool catalog cache is stale, fetching %d tools", tool_count)
+        result = await session.run("MATCH (t:Tool) RETURN t.id AS toolId")
+        tools = [record["toolId"] async for record in result]
+
+    _write_tool_cache({"key": cache_key, "count": tool_count, "tools": tools})
+    return tools
+
+
+def _read_tool_cache():
+    try:
+        with open(TOOL_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_tool_cache(cache: dict):
+    try:
+        with open(TOOL_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        logger.warning("Could not write tool cache %s: %s", TOOL_CACHE_PATH, e)
@@ -1,119 +1,243 @@
+import numpy as np
+import asyncio
+import logging
+from collections import OrderedDict
 import pandas as pd
-from neo4j import GraphDatabase
 import os
-import sys
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+from _driver import NEO4J_DATABASE, close_driver, get_all_tool_ids, get_driver
 
-# Read Aura credentials
-AURA_URI = os.getenv("NEO4J_URI")
-AURA_USER = os.getenv("NEO4J_USER")
-AURA_PASSWORD = os.getenv("NEO4J_PASSWORD")
+logger = logging.getLogger(__name__)
 
-# Check if the environment variables are set
-if not all([AURA_URI, AURA_USER, AURA_PASSWORD]):
-    print("FATAL: Please set the NEO4J_URI, NEO4J_USER, and NEO4J_PASSWORD environment variables.")
-    sys.exit(1)
+try:
+    from numba import njit
+except ImportError:  # numba is optional; without it _blend runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
 
+# Weights and scores are bounded in [0, 1] and need ~3 significant digits, so float32 is
+# enough; it halves the memory footprint and, with float32 scalars, doubles the SIMD width of _blend.
+WEIGHT_DTYPE = np.float32
 
-def get_ric_confidence_scores(driver, last_tool_id: str) -> pd.DataFrame:
+# In-process LRU of scores per last tool: tool id -> (recommended tool ids, confidence scores)
+SCORE_CACHE_SIZE = 1024
+_score_cache = OrderedDict()
+
+
+def clear_score_cache():
+    """
+    Drops every cached confidence score. Call after reseeding the graph.
+    """
+    _score_cache.clear()
+
+
+# Confidence scores for each tool in $steps, read from the CO_OCCURS projection
+CONFIDENCE_QUERY = """
+UNWIND $steps AS lastToolId
+MATCH (lastTool:Tool {id: lastToolId})-[r:CO_OCCURS]-(otherTool:Tool)
+WITH lastToolId, otherTool.id AS recommendedTool,
+     toFloat(r.count) / lastTool.session_count AS confidence_score
+ORDER BY confidence_score DESC
+WITH lastToolId, collect({recommendedTool: recommendedTool, confidence_score: confidence_score})[..10] AS top
+UNWIND top AS row
+RETURN lastToolId, row.recommendedTool AS recommendedTool, row.confidence_score AS confidence_score
+"""
+
+
+async def _read_scores(tx, last_tool_ids: list) -> pd.DataFrame:
+    result = await tx.run(CONFIDENCE_QUERY, steps=last_tool_ids)
+    # to_df() fills the frame straight from the driver's buffers, skipping per-record dicts
+    return await result.to_df()
+
+
+async def _fetch_raw_scores(driver, last_tool_ids: list) -> dict:
+    """
+    Runs the confidence score query for every tool in last_tool_ids in a single
+    round-trip and returns read-only (tool_ids, scores) NumPy arrays per tool.
+    Relies on Tool.session_count and the CO_OCCURS projection, which the data
+    seeder computes after loading.
+    """
+    logger.debug("Querying Neo4j for confidence scores based on %s", last_tool_ids)
+    async with driver.session(database=NEO4J_DATABASE) as session:
+        # A read transaction function can be routed to a read replica and is retried on transient errors
+        scores = await session.execute_read(_read_scores, last_tool_ids)
+    logger.debug("Found %d results from the database", len(scores))
+    groups = dict(tuple(scores.groupby("lastToolId", sort=False))) if not scores.empty else {}
+    raw_scores = {}
+    for tool in last_tool_ids:
+        group = groups.get(tool)
+        tool_ids = group["recommendedTool"].to_numpy(dtype=object) if group is not None else np.empty(0, dtype=object)
+        confidence = group["confidence_score"].to_numpy(dtype=WEIGHT_DTYPE) if group is not None else np.empty(0, dtype=WEIGHT_DTYPE)
+        # Cached arrays are shared between callers, so freeze them
+        tool_ids.flags.writeable = False
+        confidence.flags.writeable = False
+        raw_scores[tool] = (tool_ids, confidence)
+    return raw_scores
+
+
+async def get_ric_confidence_scores(driver, last_tool_ids: list) -> dict:
+    """
+    Returns (recommended tool ids, confidence scores) arrays per tool in last_tool_ids, querying
+    Neo4j only for tools that are not already in the in-process cache.
     """
-    Connects to Neo4j, runs the confidence score query, and returns a DataFrame.
+    wanted = list(dict.fromkeys(last_tool_ids))
+    # Take the cache hits before awaiting: a concurrent call may evict them meanwhile
+    raw_scores = {tool: _score_cache[tool] for tool in wanted if tool in _score_cache}
+    missing = [tool for tool in wanted if tool not in raw_scores]
+    if missing:
+        raw_scores.update(await _fetch_raw_scores(driver, missing))
+    for tool in wanted:
+        # Re-inserting marks the entry most recently used, even if it was evicted during the await
+        _score_cache.pop(tool, None)
+        _score_cache[tool] = raw_scores[tool]
+    while len(_score_cache) > SCORE_CACHE_SIZE:
+        _score_cache.popitem(last=False)
+    return {tool: raw_scores[tool] for tool in last_tool_ids}
+
+
+@njit(cache=True, fastmath=True)
+def _blend(weights, alpha, beta, idx, scores):
     """
-    print(f"\n--- Querying Neo4j for confidence scores based on '{last_tool_id}' ---")
-    query = """
-    WITH $last_tool_id AS lastToolId
-    MATCH (lastTool:Tool {id: lastToolId})
-    MATCH (lastTool)<-[:EXECUTED]-(:Job)-[:IN_SESSION]->(s:Session)
-    WITH COLLECT(DISTINCT s) AS sessions_with_last_tool, lastTool
-    WITH size(sessions_with_last_tool) AS last_tool_session_count, sessions_with_last_tool, lastTool
-    UNWIND sessions_with_last_tool AS s
-    MATCH (s)<-[:IN_SESSION]-(:Job)-[:EXECUTED]->(otherTool:Tool)
-    WHERE otherTool <> lastTool
-    WITH last_tool_session_count, otherTool, count(DISTINCT s) AS joint_session_count
-    RETURN otherTool.id AS recommendedTool,
-           toFloat(joint_session_count) / last_tool_session_count AS confidence_score
-    ORDER BY confidence_score DESC
-    LIMIT 10;
+    Fades every weight by alpha, then adds beta * score at each idx, in place.
+    alpha and beta share the weights' dtype so the loop never widens to float64.
     """
-    records = []
-    with driver.session() as session:
-        result = session.run(query, last_tool_id=last_tool_id)
-        records = [{"recommendedTool": record["recommendedTool"], "confidence_score": record["confidence_score"]} for record in result]
-    print(f"--- Found {len(records)} results from the database ---")
-    return pd.DataFrame(records)
+    weights *= alpha
+    for i in range(idx.shape[0]):
+        weights[idx[i]] += beta * scores[i]
 
 
 class UserSessionRecommender:
-    def __init__(self, driver, all_tool_ids: list, alpha: float = 0.3):
+    def __init__(self, driver, all_tool_ids: list, alpha: float = 0.3, verbose: bool = False):
         self.driver = driver
         self.alpha = alpha
-        self.session_weights = pd.DataFrame(
-            {'tool': all_tool_ids, 'weight': 0.0}
-        ).set_index('tool')
-        print("--- New User Session Started ---")
+        # Step narration is for the demo; keep it off on hot paths
+        self.verbose = verbose
+        # Session memory is one contiguous weight vector; tool_idx maps a tool id to its slot
+        self.tools: list[str] = list(all_tool_ids)
+        self.tool_idx: dict[str, int] = {tool: i for i, tool in enumerate(self.tools)}
+        self.weights: np.ndarray = np.zeros(len(self.tools), dtype=WEIGHT_DTYPE)
+        if self.verbose:
+            print("--- New User Session Started ---")
 
-    def update_recommendations(self, last_tool_run: str):
+    async def update_recommendations(self, last_tool_run: str):
         """
-        Updates session weights and returns top recommendations.
+        Fetches confidence scores for the tool just run, then applies them.
         """
-        confidence_scores = get_ric_confidence_scores(self.driver, last_tool_run).set_index('recommendedTool')
-        
-        print(f"\nStep Details for '{last_tool_run}':")
-        print("1. Fading old weights (multiplying by alpha={})...".format(self.alpha))
-        self.session_weights['weight'] *= self.alpha
+        confidence_scores = (await get_ric_confidence_scores(self.driver, [last_tool_run]))[last_tool_run]
+        return self.apply_confidence_scores(last_tool_run, confidence_scores)
+
+    def apply_confidence_scores(self, last_tool_run: str, confidence_scores: tuple):
+        """
+        Updates session weights with already-fetched (tool_ids, scores) arrays and
+        returns top recommendations.
+        """
+        tool_ids, scores = confidence_scores
         
-        print("2. Blending in new confidence scores...")
-        for tool, row in confidence_scores.iterrows():
-            new_score = (1 - self.alpha) * row['confidence_score']
-            self.session_weights.loc[tool, 'weight'] += new_score
-            
-        recommendations = self.session_weights.drop(last_tool_run, errors='ignore')
-        return recommendations.sort_values('weight', ascending=False).head(5)
+        if self.verbose:
+            print(f"\nStep Details for '{last_tool_run}':")
+            print("1. Fading old weights (multiplying by alpha={})...".format(self.alpha))
+            print("2. Blending in new confidence scores...")
+        unknown = [t for t in dict.fromkeys(tool_ids) if t not in self.tool_idx]
+        if unknown:
+            self._add_tools(unknown)
+        idx = np.fromiter((self.tool_idx[t] for t in tool_ids), dtype=np.int64, count=len(tool_ids))
+        _blend(self.weights, WEIGHT_DTYPE(self.alpha), WEIGHT_DTYPE(1 - self.alpha), idx, scores)
+
+        return self.top_k(5, exclude=last_tool_run)
+
+    def _add_tools(self, tool_ids: list):
+        """
+        Gives tools missing from the catalog (e.g. added after it was loaded) a zero-weight slot.
+        """
+        for tool in tool_ids:
+            self.tool_idx[tool] = len(self.tools)
+            self.tools.append(tool)
+        self.weights = np.concatenate([self.weights, np.zeros(len(tool_ids), dtype=WEIGHT_DTYPE)])
+
+    def top_k(self, k: int, exclude: str = None) -> list:
+        """
+        Returns the k highest-weighted (tool, weight) pairs, best first, skipping
+        `exclude`. Uses an O(N) argpartition rather than sorting every weight.
+        """
+        # The excluded tool can occupy at most one slot, so select one extra.
+        n = min(k + (exclude is not None), len(self.weights))
+        if n == 0:
+            return []
+        top = np.argpartition(-self.weights, n - 1)[:n]
+        top = top[np.argsort(-self.weights[top], kind='stable')]
+        return [(self.tools[i], float(self.weights[i])) for i in top if self.tools[i] != exclude][:k]
+
+    def memory_top(self, k: int = 5) -> list:
+        """
+        Returns the k strongest entries of the session memory, including the last tool run.
+        """
+        return self.top_k(k)
+
+def print_ranking(ranking: list):
+    for tool, weight in ranking:
+        print(f"{tool:<25} {weight:.4f}")
+
 
 # --- Main Simulation Logic (3 STEPS) ---
-if __name__ == "__main__":
+STEPS = [
+    ("FastQC", ">>> User runs 'FastQC'"),
+    ("Trimmomatic", ">>> User now runs 'Trimmomatic'"),
+    ("MultiQC", ">>> User finally runs 'MultiQC'"),
+]
+
+
+async def main():
+    db_driver = get_driver()
     try:
-        db_driver = GraphDatabase.driver(AURA_URI, auth=(AURA_USER, AURA_PASSWORD))
-        with db_driver.session() as session:
-            result = session.run("MATCH (t:Tool) RETURN t.id as toolId")
-            ALL_TOOLS = [record["toolId"] for record in result]
+        # The scores for each step don't depend on the session state, so fetch them all in one query
+        step_scores = await get_ric_confidence_scores(db_driver, [tool for tool, _ in STEPS])
+        recommended = {tool for tool_ids, _ in step_scores.values() for tool in tool_ids}
+        ALL_TOOLS = await get_all_tool_ids(db_driver, required=recommended)
 
         # 1. Start a new session
-        recommender = UserSessionRecommender(driver=db_driver, all_tool_ids=ALL_TOOLS, alpha=0.3)
+        recommender = UserSessionRecommender(driver=db_driver, all_tool_ids=ALL_TOOLS, alpha=0.3, verbose=True)
         print(f"Initialized recommender with {len(ALL_TOOLS)} tools.")
 
-        # =================== STEP 1 ===================
-        print("\n" + "="*25 + " STEP 1 " + "="*25)
-        print(">>> User runs 'FastQC'")
-        recommendations_1 = recommender.update_recommendations('FastQC')
-        print("\nRECOMMENDATIONS AFTER STEP 1:")
-        print(recommendations_1)
-        print("\nInternal Session Memory (Top 5):")
-        print(recommender.session_weights.sort_values('weight', ascending=False).head())
-
-        # =================== STEP 2 ===================
-        print("\n" + "="*25 + " STEP 2 " + "="*25)
-        print(">>> User now runs 'Trimmomatic'")
-        recommendations_2 = recommender.update_recommendations('Trimmomatic')
-        print("\nRECOMMENDATIONS AFTER STEP 2:")
-        print(recommendations_2)
-        print("\nInternal Session Memory (Top 5):")
-        print(recommender.session_weights.sort_values('weight', ascending=False).head())
-
-        # =================== STEP 3 ===================
-        print("\n" + "="*25 + " STEP 3 " + "="*25)
-        print(">>> User finally runs 'MultiQC'")
-        recommendations_3 = recommender.update_recommendations('MultiQC')
-        print("\nRECOMMENDATIONS AFTER STEP 3:")
-        print(recommendations_3)
-        print("\nInternal Session Memory (Top 5):")
-        print(recommender.session_weights.sort_values('weight', ascending=False).head())
-
-        db_driver.close()
-        
+        for step, (tool, banner) in enumerate(STEPS, start=1):
+            print("\n" + "="*25 + f" STEP {step} " + "="*25)
+            print(banner)
+            recommendations = recommender.apply_confidence_scores(tool, step_scores[tool])
+            print(f"\nRECOMMENDATIONS AFTER STEP {step}:")
+            print_ranking(recommendations)
+            print("\nInternal Session Memory (Top 5):")
+            print_ranking(recommender.memory_top())
+    finally:
+        await close_driver()
+
+
+class _NarrationFormatter(logging.Formatter):
+    """
+    Renders debug/info messages like the demo's own '--- ... ---' narration;
+    warnings and errors keep the standard level-prefixed format.
+    """
+    def format(self, record):
+        if record.levelno < logging.WARNING:
+            return f"--- {record.getMessage()} ---"
+        return super().format(record)
+
+
+def configure_logging():
+    # Set LOG_LEVEL=DEBUG to see the Neo4j round-trips
+    level = os.getenv("LOG_LEVEL", "WARNING").upper()
+    if not isinstance(logging.getLevelName(level), int):
+        print(f"Ignoring invalid LOG_LEVEL={level!r}; using WARNING.")
+        level = "WARNING"
+    handler = logging.StreamHandler()
+    handler.setFormatter(_NarrationFormatter("%(levelname)s:%(name)s:%(message)s"))
+    logging.getLogger().addHandler(handler)
+    for name in (__name__, "_driver"):
+        logging.getLogger(name).setLevel(level)
+
+
+if __name__ == "__main__":
+    configure_logging()
+    try:
+        asyncio.run(main())
     except Exception as e:
         print(f"\nAn error occurred: {e}")
-        print("Please check your Aura credentials and that the tools ('FastQC', 'Trimmomatic', 'MultiQC') exist in your database.")
\ No newline at end of file
+        print("Please check your Aura credentials and that the tools ('FastQC', 'Trimmomatic', 'MultiQC') exist in your database.")
@@ -1,13 +1,21 @@
-import random
-import uuid
-from datetime import datetime, timedelta
+import argparse
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
 
 # --- Configuration (SMALLER VERSION) ---
 NUM_USERS = 10
-NUM_SESSIONS_PER_USER = random.randint(2, 5)
+MIN_SESSIONS_PER_USER = 2
+MAX_SESSIONS_PER_USER = 5
 NUM_TOOLS = 25
 MIN_STEPS_PER_SESSION = 3
 MAX_STEPS_PER_SESSION = 8
+GALAXY_NAME = "Galaxy Platform"
+# Rows sent per UNWIND statement
+BATCH_SIZE = 10_000
 
 # --- Sample Tool Names (A smaller, focused set) ---
 TOOLS = [
@@ -19,56 +27,203 @@ TOOLS = [
     "PCA_Plot", "Python_script"
 ]
 
-def generate_cypher_script():
-    """Generates the full Cypher script to create the graph."""
-    cypher_commands = []
-    cypher_commands.append("MERGE (g:Galaxy {name: 'Galaxy Platform'});")
-
-    # --- Create Tool Nodes ---
-    for tool_id in TOOLS:
-        cypher_commands.append("MERGE (:Tool {{id: '{}'}})-[:IS_PART_OF]->(g);".format(tool_id))
-
-    # --- Create User and Session Data ---
-    for i in range(NUM_USERS):
-        user_id = "user_{}".format(uuid.uuid4().hex[:8])
-        cypher_commands.append("MERGE (:User {{id: '{}'}});".format(user_id))
-
-        for j in range(NUM_SESSIONS_PER_USER):
-            session_id = "session_{}".format(uuid.uuid4().hex[:12])
-            cypher_commands.append("MERGE (s:Session {{id: '{}'}})-[:BELONGS_TO]->(:User {{id: '{}'}});".format(session_id, user_id))
-
-            num_steps = random.randint(MIN_STEPS_PER_SESSION, MAX_STEPS_PER_SESSION)
-            session_tools = random.sample(TOOLS, num_steps)
-            start_time = datetime.now() - timedelta(days=random.randint(1, 365))
-            
-            previous_job_id = None
-
-            for k in range(num_steps):
-                job_id = "job_{}".format(uuid.uuid4().hex[:10])
-                tool_id = session_tools[k]
-                timestamp_iso = (start_time + timedelta(minutes=k * 5)).isoformat()
-
-                # --- This section is rewritten to be more robust ---
-                # 1. Create Job and link to Session
-                job_creation_query = "MATCH (s:Session {{id: '{}'}}) MERGE (j:Job {{id: '{}', timestamp: datetime('{}')}})-[:IN_SESSION]->(s);"
-                cypher_commands.append(job_creation_query.format(session_id, job_id, timestamp_iso))
-                
-                # 2. Link Job to the Tool it used
-                tool_link_query = "MATCH (j:Job {{id: '{}'}}), (t:Tool {{id: '{}'}}) MERGE (j)-[:EXECUTED]->(t);"
-                cypher_commands.append(tool_link_query.format(job_id, tool_id))
-
-                # 3. If not the first job, link to the previous one
-                if previous_job_id:
-                    precedes_link_query = "MATCH (prev:Job {{id: '{}'}}), (curr:Job {{id: '{}'}}) MERGE (prev)-[:PRECEDES]->(curr);"
-                    cypher_commands.append(precedes_link_query.format(previous_job_id, job_id))
-                
-                previous_job_id = job_id
-
-    return "\n".join(cypher_commands)
+# --- Uniqueness constraints, created before any batch so MERGE uses an index lookup ---
+CONSTRAINT_QUERIES = [
+    "CREATE CONSTRAINT tool_id IF NOT EXISTS FOR (t:Tool) REQUIRE t.id IS UNIQUE",
+    "CREATE CONSTRAINT job_id IF NOT EXISTS FOR (j:Job) REQUIRE j.id IS UNIQUE",
+    "CREATE CONSTRAINT session_id IF NOT EXISTS FOR (s:Session) REQUIRE s.id IS UNIQUE",
+    "CREATE CONSTRAINT user_id IF NOT EXISTS FOR (u:User) REQUIRE u.id IS UNIQUE",
+]
+
+# --- Batched Cypher templates, one per entity type, fed with $rows (and $galaxy) ---
+# Running each template over a list of rows lets Neo4j plan it once instead of
+# once per MERGE statement. Order matters: later batches MATCH earlier nodes.
+BATCH_QUERIES = {
+    "tools": """
+        MERGE (g:Galaxy {name: $galaxy})
+        WITH g
+        UNWIND $rows AS r
+        MERGE (t:Tool {id: r.id})
+        MERGE (t)-[:IS_PART_OF]->(g)
+    """,
+    "users": """
+        UNWIND $rows AS r
+        MERGE (:User {id: r.id})
+    """,
+    "sessions": """
+        UNWIND $rows AS r
+        MATCH (u:User {id: r.user_id})
+        MERGE (s:Session {id: r.id})
+        MERGE (s)-[:BELONGS_TO]->(u)
+    """,
+    "jobs": """
+        UNWIND $rows AS r
+        MATCH (s:Session {id: r.session_id})
+        MERGE (j:Job {id: r.id})
+        SET j.timestamp = datetime(r.timestamp)
+        MERGE (j)-[:IN_SESSION]->(s)
+        WITH j, r
+        MATCH (t:Tool {id: r.tool_id})
+        MERGE (j)-[:EXECUTED]->(t)
+    """,
+    "precedes": """
+        UNWIND $rows AS r
+        MATCH (prev:Job {id: r.prev_id}), (curr:Job {id: r.curr_id})
+        MERGE (prev)-[:PRECEDES]->(curr)
+    """,
+}
+
+
+# --- Derived properties, recomputed after every load so the recommender can read them directly ---
+AGGREGATE_QUERIES = [
+    # Number of distinct sessions each tool ran in: the confidence score denominator
+    """
+        MATCH (t:Tool)<-[:EXECUTED]-(:Job)-[:IN_SESSION]->(s:Session)
+        WITH t, count(DISTINCT s) AS session_count
+        SET t.session_count = session_count
+    """,
+    # Tool x tool co-occurrence, stored once per unordered pair: the confidence score numerator.
+    # Counts are upserted and only pairs that no longer co-occur are deleted, all in one
+    # statement, so concurrent readers never see the projection empty or half-built.
+    """
+        MATCH (t1:Tool)<-[:EXECUTED]-(:Job)-[:IN_SESSION]->(s:Session)<-[:IN_SESSION]-(:Job)-[:EXECUTED]->(t2:Tool)
+        WHERE t1.id < t2.id
+        WITH t1, t2, count(DISTINCT s) AS joint_session_count
+        MERGE (t1)-[r:CO_OCCURS]->(t2)
+        SET r.count = joint_session_count
+        WITH collect(r) AS current
+        MATCH ()-[stale:CO_OCCURS]->()
+        WHERE NOT stale IN current
+        DELETE stale
+    """,
+]
+
+
+def _random_ids(rng, prefix: str, count: int, hex_len: int) -> np.ndarray:
+    """Draws `count` ids of the form '<prefix>_<hex_len hex digits>' from rng."""
+    stride = 2 * ((hex_len + 1) // 2)
+    digits = rng.bytes(count * stride // 2).hex()
+    return np.array(["{}_{}".format(prefix, digits[i * stride:i * stride + hex_len]) for i in range(count)])
+
+
+def generate_tables(seed=None, now=None) -> dict:
+    """
+    Generates the synthetic graph as one DataFrame per BATCH_QUERIES entity.
+    Counts, tool choices, timestamps and ids are all drawn from one NumPy
+    generator, so a fixed seed and `now` reproduce the same graph.
+    """
+    rng = np.random.default_rng(seed)
+    now = now if now is not None else datetime.now()
+    tools = np.array(TOOLS)
+
+    # --- Users and their Sessions ---
+    user_ids = _random_ids(rng, "user", NUM_USERS, 8)
+    sessions_per_user = rng.integers(MIN_SESSIONS_PER_USER, MAX_SESSIONS_PER_USER + 1, size=NUM_USERS)
+    num_sessions = int(sessions_per_user.sum())
+    session_ids = _random_ids(rng, "session", num_sessions, 12)
+
+    # --- Jobs: each session runs step_counts[i] distinct tools, 5 minutes apart ---
+    step_counts = rng.integers(MIN_STEPS_PER_SESSION, MAX_STEPS_PER_SESSION + 1, size=num_sessions)
+    # The leading columns of a per-row random permutation are a sample without replacement
+    session_tools = rng.random((num_sessions, len(TOOLS))).argsort(axis=1)[:, :MAX_STEPS_PER_SESSION]
+    step_mask = np.arange(MAX_STEPS_PER_SESSION) < step_counts[:, None]
+    steps = np.broadcast_to(np.arange(MAX_STEPS_PER_SESSION), step_mask.shape)[step_mask]
+    num_jobs = int(step_counts.sum())
+    job_ids = _random_ids(rng, "job", num_jobs, 10)
+    start_times = np.datetime64(now, "us") - rng.integers(1, 366, size=num_sessions).astype("timedelta64[D]")
+    job_times = np.repeat(start_times, step_counts) + (steps * 5).astype("timedelta64[m]")
+
+    # Consecutive jobs of the same session are linked; step 0 starts a new session
+    follows = steps[1:] > 0
+
+    return {
+        "tools": pd.DataFrame({"id": tools}),
+        "users": pd.DataFrame({"id": user_ids}),
+        "sessions": pd.DataFrame({"id": session_ids, "user_id": np.repeat(user_ids, sessions_per_user)}),
+        "jobs": pd.DataFrame({
+            "id": job_ids,
+            "session_id": np.repeat(session_ids, step_counts),
+            "tool_id": tools[session_tools[step_mask]],
+            "timestamp": np.datetime_as_string(job_times, unit="us"),
+        }),
+        "precedes": pd.DataFrame({"prev_id": job_ids[:-1][follows], "curr_id": job_ids[1:][follows]}),
+    }
+
+
+def build_statements(rows: dict, batch_size: int = BATCH_SIZE):
+    """
+    Pairs each fixed Cypher template with its parameters, as (template, params)
+    tuples ready for session.run(template, **params). Only parameters vary, so
+    Neo4j's plan cache serves every statement after the first per template.
+    """
+    statements = [(query, {}) for query in CONSTRAINT_QUERIES]
+    for name, query in BATCH_QUERIES.items():
+        entity_rows = rows.get(name, [])
+        for start in range(0, len(entity_rows), batch_size):
+            statements.append((query, {"galaxy": GALAXY_NAME, "rows": entity_rows[start:start + batch_size]}))
+    statements.extend((query, {}) for query in AGGREGATE_QUERIES)
+    return statements
+
+
+def emit_nodes_csv(tables: dict, out_dir: str) -> list:
+    """
+    Writes one CSV per node label with neo4j-admin import headers and returns the paths.
+    """
+    nodes = {
+        "galaxy.csv": pd.DataFrame({"name:ID(Galaxy)": [GALAXY_NAME], ":LABEL": "Galaxy"}),
+        "tools.csv": pd.DataFrame({"id:ID(Tool)": tables["tools"]["id"], ":LABEL": "Tool"}),
+        "users.csv": pd.DataFrame({"id:ID(User)": tables["users"]["id"], ":LABEL": "User"}),
+        "sessions.csv": pd.DataFrame({"id:ID(Session)": tables["sessions"]["id"], ":LABEL": "Session"}),
+        "jobs.csv": pd.DataFrame({"id:ID(Job)": tables["jobs"]["id"], "timestamp:datetime": tables["jobs"]["timestamp"], ":LABEL": "Job"}),
+    }
+    return _write_csvs(nodes, out_dir)
+
+
+def emit_rels_csv(tables: dict, out_dir: str) -> list:
+    """
+    Writes one CSV per relationship type with neo4j-admin import headers and returns the paths.
+    """
+    tools, sessions, jobs, precedes = (tables[name] for name in ("tools", "sessions", "jobs", "precedes"))
+    rels = {
+        "is_part_of.csv": pd.DataFrame({":START_ID(Tool)": tools["id"], ":END_ID(Galaxy)": GALAXY_NAME, ":TYPE": "IS_PART_OF"}),
+        "belongs_to.csv": pd.DataFrame({":START_ID(Session)": sessions["id"], ":END_ID(User)": sessions["user_id"], ":TYPE": "BELONGS_TO"}),
+        "in_session.csv": pd.DataFrame({":START_ID(Job)": jobs["id"], ":END_ID(Session)": jobs["session_id"], ":TYPE": "IN_SESSION"}),
+        "executed.csv": pd.DataFrame({":START_ID(Job)": jobs["id"], ":END_ID(Tool)": jobs["tool_id"], ":TYPE": "EXECUTED"}),
+        "precedes.csv": pd.DataFrame({":START_ID(Job)": precedes["prev_id"], ":END_ID(Job)": precedes["curr_id"], ":TYPE": "PRECEDES"}),
+    }
+    return _write_csvs(rels, out_dir)
+
+
+def _write_csvs(frames: dict, out_dir: str) -> list:
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for file_name, frame in frames.items():
+        path = os.path.join(out_dir, file_name)
+        frame.to_csv(path, index=False)
+        paths.append(path)
+    return paths
 
 # --- Main Execution ---
 if __name__ == "__main__":
-    cypher_script = generate_cypher_script()
-    with open("synthetic_galaxy_data.cypher", "w") as f:
-        f.write(cypher_script)
-    print("Successfully generated FINAL 'synthetic_galaxy_data.cypher'")
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Generate synthetic Galaxy session data.")
+    parser.add_argument("--format", choices=["json", "csv"], default="json",
+                        help="json: UNWIND parameter rows for load_data.py; csv: files for neo4j-admin database import")
+    parser.add_argument("--out-dir", default="import", help="Directory for the CSV files (csv format only)")
+    args = parser.parse_args()
+
+    tables = generate_tables()
+    if args.format == "csv":
+        node_paths = emit_nodes_csv(tables, args.out_dir)
+        rel_paths = emit_rels_csv(tables, args.out_dir)
+        print(f"Successfully generated {len(node_paths) + len(rel_paths)} CSV files in '{args.out_dir}'")
+        print("Import them into a stopped, empty database with:")
+        print("  neo4j-admin database import full neo4j --overwrite-destination "
+              + " ".join(f"--nodes={p}" for p in node_paths) + " "
+              + " ".join(f"--relationships={p}" for p in rel_paths))
+        print("then create constraints and derived properties with: python data_seeder/load_data.py --post-import")
+    else:
+        rows = {name: table.to_dict("records") for name, table in tables.items()}
+        with open("synthetic_galaxy_data.json", "w") as f:
+            json.dump(rows, f, indent=2)
+        print("Successfully generated FINAL 'synthetic_galaxy_data.json'")
+        print("Load it with: python data_seeder/load_data.py synthetic_galaxy_data.json")
@@ -0,0 +1,54 @@
+import argparse
+import json
+import os
+import sys
+from dotenv import load_dotenv
+from neo4j import GraphDatabase
+
+from generate_data import build_statements
+
+# Load environment variables from .env file
+load_dotenv()
+
+# Read Aura credentials
+AURA_URI = os.getenv("NEO4J_URI")
+AURA_USER = os.getenv("NEO4J_USER")
+AURA_PASSWORD = os.getenv("NEO4J_PASSWORD")
+NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
+
+if not all([AURA_URI, AURA_USER, AURA_PASSWORD]):
+    print("FATAL: Please set the NEO4J_URI, NEO4J_USER, and NEO4J_PASSWORD environment variables.")
+    sys.exit(1)
+
+
+def run_statements(session, statements: list):
+    """Runs (template, params) tuples as parameterized queries."""
+    for query, params in statements:
+        session.run(query, **params).consume()
+
+
+# --- Main Execution ---
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load synthetic Galaxy session data into Neo4j.")
+    parser.add_argument("data_path", nargs="?", default="synthetic_galaxy_data.json",
+                        help="JSON rows written by generate_data.py")
+    parser.add_argument("--post-import", action="store_true",
+                        help="Data was bulk-imported from CSV: only create constraints and derived properties")
+    args = parser.parse_args()
+
+    if args.post_import:
+        rows = {}
+    else:
+        with open(args.data_path) as f:
+            rows = json.load(f)
+
+    driver = GraphDatabase.driver(AURA_URI, auth=(AURA_USER, AURA_PASSWORD))
+    try:
+        with driver.session(database=NEO4J_DATABASE) as session:
+            run_statements(session, build_statements(rows))
+    finally:
+        driver.close()
+    if args.post_import:
+        print("Successfully created constraints and derived properties")
+    else:
+        print(f"Successfully loaded '{args.data_path}'")
@@ -0,0 +1,11 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "RIC_demo"))
+sys.path.insert(0, os.path.join(ROOT, "data_seeder"))
+
+# _driver exits at import without credentials; nothing here connects to them
+os.environ.setdefault("NEO4J_URI", "neo4j://localhost:7687")
+os.environ.setdefault("NEO4J_USER", "neo4j")
+os.environ.setdefault("NEO4J_PASSWORD", "test")
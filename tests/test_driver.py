@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+import _driver
+
+
+class FakeResult:
+    def __init__(self, records):
+        self.records = records
+
+    async def single(self):
+        return self.records[0]
+
+    def __aiter__(self):
+        async def records():
+            for record in self.records:
+                yield record
+        return records()
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def run(self, query, **params):
+        if "count(t)" in query:
+            return FakeResult([{"toolCount": len(self.driver.tools)}])
+        self.driver.catalog_reads += 1
+        return FakeResult([{"toolId": tool} for tool in self.driver.tools])
+
+
+class FakeDriver:
+    def __init__(self, tools):
+        self.tools = tools
+        self.catalog_reads = 0
+
+    def session(self, **kwargs):
+        return FakeSession(self)
+
+
+@pytest.fixture(autouse=True)
+def tool_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(_driver, "TOOL_CACHE_PATH", str(tmp_path / "tools.json"))
+
+
+def test_catalog_is_served_from_disk_while_unchanged():
+    driver = FakeDriver(["A", "B"])
+
+    assert asyncio.run(_driver.get_all_tool_ids(driver)) == ["A", "B"]
+    assert asyncio.run(_driver.get_all_tool_ids(driver, required={"A"})) == ["A", "B"]
+    assert driver.catalog_reads == 1
+
+
+def test_catalog_is_reread_when_a_required_tool_is_missing():
+    asyncio.run(_driver.get_all_tool_ids(FakeDriver(["A", "B"])))
+    # Same count, different ids: only the required check can notice
+    driver = FakeDriver(["A", "C"])
+
+    assert asyncio.run(_driver.get_all_tool_ids(driver, required={"C"})) == ["A", "C"]
+    assert driver.catalog_reads == 1
@@ -0,0 +1,61 @@
+from datetime import datetime
+
+import pandas as pd
+
+import generate_data
+
+NOW = datetime(2024, 6, 1, 12, 0, 0)
+
+
+def test_same_seed_reproduces_the_same_graph():
+    first = generate_data.generate_tables(seed=7, now=NOW)
+    second = generate_data.generate_tables(seed=7, now=NOW)
+
+    for name in first:
+        pd.testing.assert_frame_equal(first[name], second[name])
+    assert not first["jobs"]["id"].equals(generate_data.generate_tables(seed=8, now=NOW)["jobs"]["id"])
+
+
+def test_tables_respect_configured_shape():
+    tables = generate_data.generate_tables(seed=1, now=NOW)
+    sessions, jobs, precedes = tables["sessions"], tables["jobs"], tables["precedes"]
+
+    per_user = sessions.groupby("user_id").size()
+    assert per_user.between(generate_data.MIN_SESSIONS_PER_USER, generate_data.MAX_SESSIONS_PER_USER).all()
+    per_session = jobs.groupby("session_id")["tool_id"]
+    assert per_session.size().between(generate_data.MIN_STEPS_PER_SESSION, generate_data.MAX_STEPS_PER_SESSION).all()
+    assert per_session.nunique().equals(per_session.size())
+    assert jobs["id"].is_unique and sessions["id"].is_unique
+    assert jobs["id"].str.fullmatch(r"job_[0-9a-f]{10}").all()
+    assert len(precedes) == len(jobs) - len(sessions)
+
+
+def test_precedes_links_consecutive_jobs_of_one_session():
+    jobs = generate_data.generate_tables(seed=3, now=NOW)["jobs"].set_index("id")
+    precedes = generate_data.generate_tables(seed=3, now=NOW)["precedes"]
+
+    prev, curr = jobs.loc[precedes["prev_id"]], jobs.loc[precedes["curr_id"]]
+    assert (prev["session_id"].to_numpy() == curr["session_id"].to_numpy()).all()
+    gap = pd.to_datetime(curr["timestamp"].to_numpy()) - pd.to_datetime(prev["timestamp"].to_numpy())
+    assert (gap == pd.Timedelta(minutes=5)).all()
+
+
+def test_build_statements_chunks_rows_between_schema_and_aggregates():
+    rows = {"tools": [{"id": t} for t in "ABCDE"], "users": [{"id": "u"}]}
+
+    statements = generate_data.build_statements(rows, batch_size=2)
+
+    num_constraints = len(generate_data.CONSTRAINT_QUERIES)
+    assert [q for q, _ in statements[:num_constraints]] == generate_data.CONSTRAINT_QUERIES
+    assert [q for q, _ in statements[-len(generate_data.AGGREGATE_QUERIES):]] == generate_data.AGGREGATE_QUERIES
+    batches = statements[num_constraints:-len(generate_data.AGGREGATE_QUERIES)]
+    tool_query, user_query = generate_data.BATCH_QUERIES["tools"], generate_data.BATCH_QUERIES["users"]
+    assert [q for q, _ in batches] == [tool_query, tool_query, tool_query, user_query]
+    assert [len(params["rows"]) for _, params in batches] == [2, 2, 1, 1]
+    assert all(params["galaxy"] == generate_data.GALAXY_NAME for _, params in batches)
+
+
+def test_build_statements_without_rows_only_sets_up_schema_and_aggregates():
+    statements = generate_data.build_statements({})
+
+    assert [q for q, _ in statements] == generate_data.CONSTRAINT_QUERIES + generate_data.AGGREGATE_QUERIES
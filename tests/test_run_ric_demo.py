@@ -0,0 +1,115 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import run_ric_demo
+
+
+class FakeSession:
+    def __init__(self, driver):
+        self.driver = driver
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute_read(self, func, last_tool_ids):
+        self.driver.queries.append(list(last_tool_ids))
+        # Yield so concurrent callers interleave around the round-trip
+        for _ in range(self.driver.latency.get(last_tool_ids[0], 1)):
+            await asyncio.sleep(0)
+        return pd.DataFrame(
+            [(tool, f"{tool}_next", 0.5) for tool in last_tool_ids],
+            columns=["lastToolId", "recommendedTool", "confidence_score"],
+        )
+
+
+class FakeDriver:
+    def __init__(self, latency=None):
+        self.queries = []
+        # Event-loop ticks each query takes, keyed by its first tool
+        self.latency = latency or {}
+
+    def session(self, **kwargs):
+        return FakeSession(self)
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    run_ric_demo.clear_score_cache()
+    yield
+    run_ric_demo.clear_score_cache()
+
+
+def test_scores_are_cached_per_tool():
+    driver = FakeDriver()
+    asyncio.run(run_ric_demo.get_ric_confidence_scores(driver, ["A", "B"]))
+    scores = asyncio.run(run_ric_demo.get_ric_confidence_scores(driver, ["B", "C"]))
+
+    assert driver.queries == [["A", "B"], ["C"]]
+    assert list(scores["B"][0]) == ["B_next"]
+    assert list(scores["C"][0]) == ["C_next"]
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(run_ric_demo, "SCORE_CACHE_SIZE", 2)
+    driver = FakeDriver()
+    for tools in (["A"], ["B"], ["A"], ["C"]):
+        asyncio.run(run_ric_demo.get_ric_confidence_scores(driver, tools))
+
+    assert list(run_ric_demo._score_cache) == ["A", "C"]
+
+
+def test_concurrent_calls_survive_eviction_of_cached_hits(monkeypatch):
+    monkeypatch.setattr(run_ric_demo, "SCORE_CACHE_SIZE", 2)
+    # The first call's fetch finishes last, after the second call has evicted 'A'
+    driver = FakeDriver(latency={"B": 3})
+    get = run_ric_demo.get_ric_confidence_scores
+    asyncio.run(get(driver, ["A"]))
+
+    async def both():
+        return await asyncio.gather(get(driver, ["A", "B"]), get(driver, ["C", "D"]))
+
+    first, second = asyncio.run(both())
+
+    assert list(first["A"][0]) == ["A_next"]
+    assert list(second["D"][0]) == ["D_next"]
+    assert len(run_ric_demo._score_cache) == 2
+
+
+def make_recommender(weights):
+    recommender = run_ric_demo.UserSessionRecommender(driver=None, all_tool_ids=list(weights))
+    recommender.weights[:] = list(weights.values())
+    return recommender
+
+
+def test_top_k_orders_best_first_and_skips_excluded():
+    recommender = make_recommender({"A": 0.1, "B": 0.9, "C": 0.5, "D": 0.7, "E": 0.0})
+
+    ranking = recommender.top_k(3, exclude="B")
+
+    assert [tool for tool, _ in ranking] == ["D", "C", "A"]
+    assert ranking[0][1] == pytest.approx(0.7)
+
+
+def test_top_k_handles_k_larger_than_catalog():
+    recommender = make_recommender({"A": 0.2, "B": 0.4})
+
+    assert [tool for tool, _ in recommender.top_k(5, exclude="A")] == ["B"]
+    assert [tool for tool, _ in recommender.memory_top(5)] == ["B", "A"]
+    assert make_recommender({}).top_k(5) == []
+
+
+def test_apply_confidence_scores_adds_tools_missing_from_catalog():
+    recommender = make_recommender({"A": 0.0, "B": 0.0})
+    scores = (np.array(["B", "NEW"], dtype=object), np.array([0.5, 1.0], dtype=run_ric_demo.WEIGHT_DTYPE))
+
+    ranking = recommender.apply_confidence_scores("A", scores)
+
+    assert [tool for tool, _ in ranking] == ["NEW", "B"]
+    assert recommender.tools == ["A", "B", "NEW"]
+    assert recommender.weights.dtype == run_ric_demo.WEIGHT_DTYPE